@@ -309,6 +309,7 @@ echo
 echo -e "${YELLOW}PRÓXIMOS PASOS:${NC}"
 echo "1. Transferir los archivos Python del proyecto:"
 echo "   - modbus_industrial_server.py"
+echo "   - modbus_crc.py"
 echo "   - modbus_web_server.py"
 echo "   - templates/ (directorio completo)"
 echo "   - static/ (directorio completo)"
@@ -0,0 +1,55 @@
+"""
+CRC-16 Modbus helpers shared by the Modbus RTU tools.
+The lookup table is built once at import time and reused by every caller.
+If crcmod is installed with its C extension, the CRC loop runs there instead.
+"""
+
+import struct
+from array import array
+
+try:
+    # Only crcmod's compiled backend beats the table loop below; its pure-Python one does not
+    import crcmod._crcfunext  # noqa: F401
+    from crcmod.predefined import mkCrcFun
+except ImportError:
+    mkCrcFun = None
+
+
+def _build_crc16_table():
+    """Build the byte-wise CRC-16 Modbus lookup table (polynomial 0xA001)"""
+    table = array('H')
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return table
+
+
+CRC16_MODBUS_TABLE = _build_crc16_table()
+_CRC_LE = struct.Struct('<H')
+
+
+def _crc16_table_loop(data: bytes) -> int:
+    """Run CRC-16 Modbus over data and return the register value"""
+    crc = 0xFFFF
+    table = CRC16_MODBUS_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+_crc16 = mkCrcFun('modbus') if mkCrcFun else _crc16_table_loop
+
+
+def calculate_crc(data: bytes) -> bytes:
+    """Calculate CRC-16 Modbus, returned LSB first as sent on the wire"""
+    return _CRC_LE.pack(_crc16(data))
+
+
+def crc_ok(frame: bytes) -> bool:
+    """Check a frame that ends with its CRC; a valid frame leaves a zero residue"""
+    return _crc16(frame) == 0
@@ -7,19 +7,66 @@ Optimized for Raspberry Pi Zero 2W
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import threading
 import time
 import json
+import collections
+import operator
+import os
 import psutil
-import subprocess
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import matplotlib.pyplot as plt
+from typing import Dict, List, Optional, Tuple, Any
+import matplotlib
+matplotlib.use('Agg')  # Charts are embedded via FigureCanvasTkAgg; pyplot is never used
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
 import numpy as np
 from modbus_industrial_server import ModbusIndustrialServer, create_example_slave
 
+try:
+    import orjson  # Optional C-accelerated JSON; stdlib json is used when missing
+except ImportError:
+    orjson = None
+
+
+# Aggregated per-slave counters, fetched as one tuple per ConnectionStats
+_STATS_COUNTERS = operator.attrgetter('successful_requests', 'failed_requests', 'bytes_sent', 'bytes_received')
+
+# Defaults shown by the configuration tab's reset button
+_DEFAULT_CONFIG = {
+    "serial": {
+        "port": "/dev/ttyUSB0",
+        "baudrate": 9600,
+        "bytesize": 8,
+        "parity": "N",
+        "stopbits": 1,
+        "timeout": 1.0
+    },
+    "server": {
+        "max_slaves": 10,
+        "log_level": "INFO",
+        "log_file": "/var/log/modbus_server.log",
+        "stats_interval": 60,
+        "backup_interval": 300
+    },
+    "performance": {
+        "memory_check_interval": 30,
+        "cpu_check_interval": 10,
+        "auto_optimize": True
+    }
+}
+
+# Serialized once at import; reset_configuration only inserts the text
+_DEFAULT_CONFIG_JSON = json.dumps(_DEFAULT_CONFIG, indent=4)
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ModbusDiagnostics:
     """Diagnostics and monitoring GUI for Modbus Industrial Server"""
     
@@ -32,16 +79,59 @@ class ModbusDiagnostics:
         self.server: Optional[ModbusIndustrialServer] = None
         self.server_running = False
         
-        # Monitoring data
-        self.cpu_data = []
-        self.memory_data = []
-        self.request_data = []
-        self.timestamps = []
+        # Monitoring data (fixed-size ring buffers, oldest sample overwritten)
         self.max_data_points = 100
-        
-        # Monitoring thread
+        self._buf_ts = np.zeros(self.max_data_points, dtype=np.float64)  # time.time() seconds
+        self._buf_cpu = np.zeros(self.max_data_points, dtype=np.float32)
+        self._buf_mem = np.zeros(self.max_data_points, dtype=np.float32)
+        self._buf_rate = np.zeros(self.max_data_points, dtype=np.float32)
+        self._head = 0  # next write position
+        self._count = 0  # number of valid samples
+        self._last_temp = 0
+        self._last_total = 0  # server request total at the previous sample
+        self._last_total_time = 0.0  # monotonic time of that sample; ticks are not evenly spaced
+        
+        # Last values written to each Treeview, keyed by widget path then iid
+        self._tree_rows: Dict[str, Dict[str, tuple]] = {}
+        self._last_stats_version: Tuple[Optional[ModbusIndustrialServer], int] = (None, -1)  # (server, stats_version) last painted
+        self._ts_cache: collections.OrderedDict = collections.OrderedDict()  # epoch second -> "HH:MM:SS"
+        
+        # Slave details window, created on first use
+        self._details_win: Optional[tk.Toplevel] = None
+        self._details_text: Optional[scrolledtext.ScrolledText] = None
+        
+        # Chart decimation: redraw once every disp_skip monitoring ticks
+        self.disp_skip = 5
+        self._tick = 0
+        
+        # Monitoring runs as a self-rescheduling after() callback on the Tk main loop
         self.monitoring_active = False
-        self.monitoring_thread: Optional[threading.Thread] = None
+        self._monitor_after_id: Optional[str] = None
+        self._monitor_start = 0.0
+        
+        # Sampling period in seconds, stretched under CPU pressure so the
+        # diagnostics back off when the Modbus server needs the CPU
+        self.monitor_interval = 2.0
+        self.max_monitor_interval = 8.0
+        self._cpu_count = psutil.cpu_count()
+        
+        # Log lines are queued and written to the Text widget in batches
+        self.max_log_lines = 2000
+        self.log_trim_lines = 1000  # Oldest lines dropped at once when max_log_lines is exceeded
+        self._log_q = collections.deque(maxlen=self.max_log_lines)
+        self._log_lines = 0  # Lines currently in the widget
+        self._log_after_id: Optional[str] = None  # Pending flush, scheduled by log_message
+        self._strftime = time.strftime  # Bound once for log_message timestamps
+        self._localtime = time.localtime
+        
+        # Server log file tail position; a new inode (rotation) restarts near the end
+        self.log_tail_bytes = 200_000
+        self._log_file_offset = 0
+        self._log_file_inode: Optional[int] = None
+        self._log_skip_partial = False  # Tail started mid-line; drop text up to the next newline
+        
+        # (mtime_ns, formatted text) of the last configuration file load
+        self._config_cache: Optional[Tuple[int, str]] = None
         
         self.create_widgets()
         self.start_monitoring()
@@ -173,24 +263,38 @@ class ModbusDiagnostics:
         self.fig = Figure(figsize=(12, 6), dpi=100)
         self.fig.suptitle('System Performance Monitoring')
         
+        # All four series share one time axis; only the bottom row shows tick labels
+        ((self.cpu_ax, self.memory_ax),
+         (self.request_ax, self.temp_ax)) = self.fig.subplots(2, 2, sharex=True)
+        
         # CPU subplot
-        self.cpu_ax = self.fig.add_subplot(221)
         self.cpu_ax.set_title('CPU Usage (%)')
         self.cpu_ax.set_ylim(0, 100)
         
         # Memory subplot
-        self.memory_ax = self.fig.add_subplot(222)
         self.memory_ax.set_title('Memory Usage (MB)')
         
         # Request rate subplot
-        self.request_ax = self.fig.add_subplot(223)
         self.request_ax.set_title('Request Rate (req/min)')
         
         # Temperature subplot
-        self.temp_ax = self.fig.add_subplot(224)
         self.temp_ax.set_title('Temperature (°C)')
         self.temp_ax.set_ylim(0, 85)
         
+        # Line artists are created once and only have their data replaced on update
+        self.cpu_line, = self.cpu_ax.plot([], [], 'b-')
+        self.memory_line, = self.memory_ax.plot([], [], 'g-')
+        self.request_line, = self.request_ax.plot([], [], 'r-')
+        self.temp_line, = self.temp_ax.plot([], [], 'orange')
+        
+        # Format x-axis; timestamps are plain epoch seconds, rendered only at tick positions
+        # (the formatter is shared along with the x-axis)
+        self.cpu_ax.xaxis.set_major_formatter(
+            FuncFormatter(lambda x, pos: time.strftime('%H:%M:%S', time.localtime(x))))
+        for ax in [self.request_ax, self.temp_ax]:
+            ax.tick_params(axis='x', rotation=45)
+        self.fig.tight_layout()
+        
         # Create canvas
         self.canvas = FigureCanvasTkAgg(self.fig, charts_frame)
         self.canvas.draw()
@@ -411,193 +515,224 @@ class ModbusDiagnostics:
         """Start system monitoring"""
         if not self.monitoring_active:
             self.monitoring_active = True
-            self.monitoring_thread = threading.Thread(target=self.monitoring_loop, daemon=True)
-            self.monitoring_thread.start()
+            self._monitor_start = time.time()
+            self._monitor_tick()
     
     def stop_monitoring(self):
         """Stop system monitoring"""
         self.monitoring_active = False
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=2)
+        if self._monitor_after_id is not None:
+            self.root.after_cancel(self._monitor_after_id)
+            self._monitor_after_id = None
     
-    def monitoring_loop(self):
-        """Main monitoring loop"""
-        start_time = time.time()
+    def _monitor_tick(self):
+        """Take one monitoring sample and schedule the next one"""
+        if not self.monitoring_active:
+            return
         
-        while self.monitoring_active:
-            try:
-                current_time = time.time()
-                
-                # Update uptime
-                if self.server_running:
-                    uptime_seconds = int(current_time - start_time)
-                    hours = uptime_seconds // 3600
-                    minutes = (uptime_seconds % 3600) // 60
-                    seconds = uptime_seconds % 60
-                    self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
-                
-                # Update system information
-                self.update_system_info()
-                
-                # Update performance charts
+        try:
+            current_time = time.time()
+            
+            # Update uptime
+            if self.server_running:
+                uptime_seconds = int(current_time - self._monitor_start)
+                hours = uptime_seconds // 3600
+                minutes = (uptime_seconds % 3600) // 60
+                seconds = uptime_seconds % 60
+                self.uptime_var.set(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+            
+            # Sample every metric once and share it between the info panel and the charts
+            sample = self._sample()
+            
+            # Update system information
+            self.update_system_info(sample)
+            
+            # Record every tick, redraw the charts every disp_skip ticks
+            self.record_performance_sample(sample)
+            if self._tick % self.disp_skip == 0:
                 self.update_performance_charts()
-                
-                # Update slave count
-                if self.server:
-                    self.slaves_var.set(str(len(self.server.slaves)))
-                
-                time.sleep(2)  # Update every 2 seconds
-                
-            except Exception as e:
-                self.log_message(f"Monitoring error: {str(e)}")
-                time.sleep(5)
+            self._tick += 1
+            
+            # Update slave count
+            if self.server:
+                self.slaves_var.set(str(len(self.server.slaves)))
+            
+            delay = self._next_monitor_interval()
+            
+        except Exception as e:
+            self.log_message(f"Monitoring error: {str(e)}")
+            delay = 5
+        
+        self._monitor_after_id = self.root.after(int(delay * 1000), self._monitor_tick)
     
-    def update_system_info(self):
+    def _next_monitor_interval(self) -> float:
+        """Sleep time before the next sample, scaled by the latest CPU load"""
+        if self._count == 0:
+            return self.monitor_interval
+        load = float(self._buf_cpu[(self._head - 1) % self.max_data_points]) / 100
+        return min(self.max_monitor_interval, self.monitor_interval * (1 + 3 * load))
+    
+    def _read_temp(self) -> Optional[float]:
+        """Read the SoC temperature in °C from sysfs, None if unavailable"""
+        try:
+            with open('/sys/class/thermal/thermal_zone0/temp', 'rb') as f:
+                return int(f.read()) / 1000.0
+        except (OSError, ValueError):
+            return None
+    
+    def _sample(self) -> Tuple[float, float, float, Optional[float], float]:
+        """Sample (cpu %, memory MB, memory %, temperature °C, disk %) once"""
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        return (cpu_percent, memory.used / 1024 / 1024, memory.percent,
+                self._read_temp(), (disk.used / disk.total) * 100)
+    
+    def update_system_info(self, sample: Tuple[float, float, float, Optional[float], float]):
         """Update system information"""
         try:
+            cpu_percent, memory_mb, memory_percent, temp, disk_percent = sample
+            
             # CPU info
-            cpu_percent = psutil.cpu_percent(interval=None)
-            cpu_count = psutil.cpu_count()
-            self.cpu_info_var.set(f"{cpu_percent:.1f}% ({cpu_count} cores)")
+            self.cpu_info_var.set(f"{cpu_percent:.1f}% ({self._cpu_count} cores)")
             
             # Memory info
-            memory = psutil.virtual_memory()
-            memory_mb = memory.used / 1024 / 1024
-            self.memory_info_var.set(f"{memory_mb:.1f}MB ({memory.percent:.1f}%)")
+            self.memory_info_var.set(f"{memory_mb:.1f}MB ({memory_percent:.1f}%)")
             
             # Temperature (Pi-specific)
-            try:
-                temp_result = subprocess.run(['vcgencmd', 'measure_temp'], 
-                                           capture_output=True, text=True, timeout=2)
-                if temp_result.returncode == 0:
-                    temp_str = temp_result.stdout.strip()
-                    temp = float(temp_str.split('=')[1].split("'")[0])
-                    self.temp_var.set(f"{temp:.1f}°C")
-                else:
-                    self.temp_var.set("N/A")
-            except:
-                self.temp_var.set("N/A")
+            self.temp_var.set(f"{temp:.1f}°C" if temp is not None else "N/A")
             
             # Disk usage
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
             self.disk_var.set(f"{disk_percent:.1f}%")
             
         except Exception as e:
             self.log_message(f"System info update error: {str(e)}")
     
-    def update_performance_charts(self):
-        """Update performance charts"""
+    def record_performance_sample(self, sample: Tuple[float, float, float, Optional[float], float]):
+        """Record performance metrics into the ring buffers"""
         try:
-            current_time = datetime.now()
-            
-            # Get current data
-            cpu_percent = psutil.cpu_percent(interval=None)
-            memory_mb = psutil.virtual_memory().used / 1024 / 1024
-            
-            # Get temperature
-            temp = 0
-            try:
-                temp_result = subprocess.run(['vcgencmd', 'measure_temp'], 
-                                           capture_output=True, text=True, timeout=1)
-                if temp_result.returncode == 0:
-                    temp_str = temp_result.stdout.strip()
-                    temp = float(temp_str.split('=')[1].split("'")[0])
-            except:
-                pass
+            current_time = time.time()
+            cpu_percent, memory_mb, _, temp, _ = sample
             
             # Get request rate (if server is running)
             request_rate = 0
             if self.server and self.server_running:
-                total_requests = sum(stats.total_requests for stats in self.server.stats.values())
-                if len(self.request_data) > 0:
-                    request_rate = max(0, total_requests - self.request_data[-1]) * 30  # requests per minute
-                else:
-                    request_rate = 0
-            
-            # Add data points
-            self.timestamps.append(current_time)
-            self.cpu_data.append(cpu_percent)
-            self.memory_data.append(memory_mb)
-            self.request_data.append(total_requests if self.server else 0)
-            
-            # Limit data points
-            if len(self.timestamps) > self.max_data_points:
-                self.timestamps.pop(0)
-                self.cpu_data.pop(0)
-                self.memory_data.pop(0)
-                self.request_data.pop(0)
-            
-            # Update charts
-            if len(self.timestamps) > 1:
-                # Clear axes
-                self.cpu_ax.clear()
-                self.memory_ax.clear()
-                self.request_ax.clear()
-                self.temp_ax.clear()
-                
-                # Plot data
-                self.cpu_ax.plot(self.timestamps, self.cpu_data, 'b-')
-                self.cpu_ax.set_title('CPU Usage (%)')
-                self.cpu_ax.set_ylim(0, 100)
-                
-                self.memory_ax.plot(self.timestamps, self.memory_data, 'g-')
-                self.memory_ax.set_title('Memory Usage (MB)')
+                total_requests = self.server.total_requests
+                now = time.monotonic()
+                elapsed = now - self._last_total_time
+                if self._count > 0 and elapsed > 0:
+                    request_rate = max(0, total_requests - self._last_total) * 60 / elapsed  # requests per minute
+                self._last_total = total_requests
+                self._last_total_time = now
+            
+            # Add data point, overwriting the oldest once the buffers are full
+            head = self._head
+            self._buf_ts[head] = current_time
+            self._buf_cpu[head] = cpu_percent
+            self._buf_mem[head] = memory_mb
+            self._buf_rate[head] = request_rate
+            self._head = (head + 1) % self.max_data_points
+            self._count = min(self._count + 1, self.max_data_points)
+            self._last_temp = temp if temp is not None else 0
+            
+        except Exception as e:
+            self.log_message(f"Performance sample error: {str(e)}")
+    
+    def update_performance_charts(self):
+        """Update performance charts"""
+        try:
+            if self._count > 1:
+                temp = self._last_temp
+                idx = self._ring_indices()
+                timestamps = self._buf_ts[idx]
                 
-                # Calculate request rates
-                request_rates = []
-                for i in range(1, len(self.request_data)):
-                    rate = (self.request_data[i] - self.request_data[i-1]) * 30  # per minute
-                    request_rates.append(max(0, rate))
+                # Replace line data
+                self.cpu_line.set_data(timestamps, self._buf_cpu[idx])
+                self.memory_line.set_data(timestamps, self._buf_mem[idx])
                 
-                if request_rates:
-                    self.request_ax.plot(self.timestamps[1:], request_rates, 'r-')
-                self.request_ax.set_title('Request Rate (req/min)')
+                self.request_line.set_data(timestamps, self._buf_rate[idx])
                 
                 # Temperature (constant line for now)
-                temp_data = [temp] * len(self.timestamps)
-                self.temp_ax.plot(self.timestamps, temp_data, 'orange')
-                self.temp_ax.set_title('Temperature (°C)')
-                self.temp_ax.set_ylim(0, 85)
+                self.temp_line.set_data(timestamps, np.full(len(idx), temp))
                 
-                # Format x-axis
-                for ax in [self.cpu_ax, self.memory_ax, self.request_ax, self.temp_ax]:
-                    ax.tick_params(axis='x', rotation=45)
+                # Rescale x on every axis; y only where the range isn't fixed
+                for ax, scaley in ((self.cpu_ax, False), (self.memory_ax, True),
+                                   (self.request_ax, True), (self.temp_ax, False)):
+                    ax.relim()
+                    ax.autoscale_view(scalex=True, scaley=scaley)
                 
-                self.fig.tight_layout()
-                self.canvas.draw()
+                self.canvas.draw_idle()
                 
         except Exception as e:
             self.log_message(f"Chart update error: {str(e)}")
     
+    def _ring_indices(self) -> np.ndarray:
+        """Ring buffer positions of the valid samples, oldest first"""
+        start = self._head - self._count
+        return (np.arange(self._count) + start) % self.max_data_points
+    
     def refresh_slaves(self):
         """Refresh slave list"""
         try:
-            # Clear existing items
-            for item in self.slave_tree.get_children():
-                self.slave_tree.delete(item)
-            
+            rows = {}
             if self.server:
                 for slave_id, slave in self.server.slaves.items():
                     stats = self.server.stats.get(slave_id)
                     
-                    last_request = "Never"
-                    if stats and stats.last_request_time > 0:
-                        last_request = datetime.fromtimestamp(stats.last_request_time).strftime("%H:%M:%S")
+                    last_request = self._format_last_request(stats.last_request_time) if stats else "Never"
                     
                     total_registers = (len(slave.holding_registers) + len(slave.input_registers) + 
                                      len(slave.coils) + len(slave.discrete_inputs))
                     
                     status = "Active" if stats and stats.total_requests > 0 else "Inactive"
                     
-                    self.slave_tree.insert('', 'end', values=(
+                    rows[str(slave_id)] = (
                         slave_id, slave.name, slave.description, 
                         total_registers, last_request, status
-                    ))
+                    )
+            
+            self._sync_tree(self.slave_tree, rows)
                     
         except Exception as e:
             self.log_message(f"Slave refresh error: {str(e)}")
     
+    def _sync_tree(self, tree: ttk.Treeview, rows: Dict[str, tuple]):
+        """Bring a Treeview in line with rows keyed by iid, touching only changed items"""
+        # The cache mirrors the tree exactly (only this method touches these items),
+        # so membership is checked in Python rather than with a Tcl round-trip per row
+        cache = self._tree_rows.setdefault(str(tree), {})
+        
+        stale = [iid for iid in cache if iid not in rows]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del cache[iid]
+        
+        insert = tree.insert
+        item = tree.item
+        for iid, values in rows.items():
+            cached = cache.get(iid)
+            if cached is None:
+                insert('', 'end', iid=iid, values=values)
+            elif cached != values:
+                item(iid, values=values)
+            else:
+                continue
+            cache[iid] = values
+    
+    def _format_last_request(self, timestamp: float) -> str:
+        """Format a last request time as HH:MM:SS, memoized per whole second"""
+        if timestamp <= 0:
+            return "Never"
+        second = int(timestamp)
+        text = self._ts_cache.get(second)
+        if text is None:
+            text = time.strftime("%H:%M:%S", time.localtime(second))
+            self._ts_cache[second] = text
+            if len(self._ts_cache) > 256:
+                self._ts_cache.popitem(last=False)
+        return text
+    
     def view_slave_details(self):
         """View detailed information about selected slave"""
         selection = self.slave_tree.selection()
@@ -611,46 +746,46 @@ class ModbusDiagnostics:
         if self.server and slave_id in self.server.slaves:
             slave_data = self.server.get_slave_data(slave_id)
             
-            # Create details window
-            details_window = tk.Toplevel(self.root)
-            details_window.title(f"Slave {slave_id} Details")
-            details_window.geometry("600x400")
-            
-            details_text = scrolledtext.ScrolledText(details_window, height=20, width=70)
-            details_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            # Create the details window once and reuse it for later selections
+            if self._details_win is None or not self._details_win.winfo_exists():
+                self._details_win = tk.Toplevel(self.root)
+                self._details_win.geometry("600x400")
+                
+                self._details_text = scrolledtext.ScrolledText(self._details_win, height=20, width=70)
+                self._details_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            else:
+                self._details_win.deiconify()
+                self._details_win.lift()
+            self._details_win.title(f"Slave {slave_id} Details")
             
             # Format slave data
-            details_text.insert(tk.END, f"Slave ID: {slave_data['slave_id']}\n")
-            details_text.insert(tk.END, f"Name: {slave_data['name']}\n")
-            details_text.insert(tk.END, f"Description: {slave_data['description']}\n\n")
-            
-            details_text.insert(tk.END, "Holding Registers:\n")
-            for addr, value in slave_data['holding_registers'].items():
-                details_text.insert(tk.END, f"  {addr}: {value}\n")
-            
-            details_text.insert(tk.END, "\nInput Registers:\n")
-            for addr, value in slave_data['input_registers'].items():
-                details_text.insert(tk.END, f"  {addr}: {value}\n")
-            
-            details_text.insert(tk.END, "\nCoils:\n")
-            for addr, value in slave_data['coils'].items():
-                details_text.insert(tk.END, f"  {addr}: {value}\n")
-            
-            details_text.insert(tk.END, "\nDiscrete Inputs:\n")
-            for addr, value in slave_data['discrete_inputs'].items():
-                details_text.insert(tk.END, f"  {addr}: {value}\n")
-            
-            details_text.insert(tk.END, "\nStatistics:\n")
+            parts = [
+                f"Slave ID: {slave_data['slave_id']}\n",
+                f"Name: {slave_data['name']}\n",
+                f"Description: {slave_data['description']}\n\n",
+            ]
+            
+            for heading, key in (("Holding Registers:\n", 'holding_registers'),
+                                 ("\nInput Registers:\n", 'input_registers'),
+                                 ("\nCoils:\n", 'coils'),
+                                 ("\nDiscrete Inputs:\n", 'discrete_inputs')):
+                parts.append(heading)
+                parts.extend(f"  {addr}: {value}\n" for addr, value in slave_data[key].items())
+            
+            parts.append("\nStatistics:\n")
             stats = slave_data['statistics']
-            details_text.insert(tk.END, f"  Total Requests: {stats['total_requests']}\n")
-            details_text.insert(tk.END, f"  Successful Requests: {stats['successful_requests']}\n")
-            details_text.insert(tk.END, f"  Failed Requests: {stats['failed_requests']}\n")
-            details_text.insert(tk.END, f"  Bytes Sent: {stats['bytes_sent']}\n")
-            details_text.insert(tk.END, f"  Bytes Received: {stats['bytes_received']}\n")
+            parts.append(f"  Total Requests: {stats['total_requests']}\n")
+            parts.append(f"  Successful Requests: {stats['successful_requests']}\n")
+            parts.append(f"  Failed Requests: {stats['failed_requests']}\n")
+            parts.append(f"  Bytes Sent: {stats['bytes_sent']}\n")
+            parts.append(f"  Bytes Received: {stats['bytes_received']}\n")
             
             if stats['last_request_time'] > 0:
                 last_time = datetime.fromtimestamp(stats['last_request_time'])
-                details_text.insert(tk.END, f"  Last Request: {last_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                parts.append(f"  Last Request: {last_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            
+            self._details_text.delete(1.0, tk.END)
+            self._details_text.insert(tk.END, ''.join(parts))
     
     def remove_slave(self):
         """Remove selected slave"""
@@ -671,17 +806,27 @@ class ModbusDiagnostics:
     def refresh_statistics(self):
         """Refresh statistics display"""
         try:
-            # Clear existing items
-            for item in self.stats_tree.get_children():
-                self.stats_tree.delete(item)
-            
-            if self.server:
+            server = self.server
+            
+            # Nothing to repaint if this server's stats are unchanged since the last refresh
+            if server:
+                version = server.stats_version
+                last_server, last_version = self._last_stats_version
+                if last_server is server and last_version == version:
+                    return
+            
+            rows = {}
+            if server:
+                stats_map = server.stats
+                
                 # Overall statistics
-                total_requests = sum(stats.total_requests for stats in self.server.stats.values())
-                total_successful = sum(stats.successful_requests for stats in self.server.stats.values())
-                total_failed = sum(stats.failed_requests for stats in self.server.stats.values())
-                total_bytes_sent = sum(stats.bytes_sent for stats in self.server.stats.values())
-                total_bytes_received = sum(stats.bytes_received for stats in self.server.stats.values())
+                total_requests = server.total_requests
+                total_successful = total_failed = total_bytes_sent = total_bytes_received = 0
+                for successful, failed, sent, received in map(_STATS_COUNTERS, stats_map.values()):
+                    total_successful += successful
+                    total_failed += failed
+                    total_bytes_sent += sent
+                    total_bytes_received += received
                 
                 success_rate = (total_successful / total_requests * 100) if total_requests > 0 else 0
                 
@@ -693,20 +838,23 @@ class ModbusDiagnostics:
                 self.bytes_received_var.set(str(total_bytes_received))
                 
                 # Per-slave statistics
-                for slave_id, slave in self.server.slaves.items():
-                    stats = self.server.stats.get(slave_id)
+                format_last_request = self._format_last_request
+                for slave_id, slave in server.slaves.items():
+                    stats = stats_map.get(slave_id)
                     if stats:
-                        slave_success_rate = (stats.successful_requests / stats.total_requests * 100) if stats.total_requests > 0 else 0
-                        
-                        last_request = "Never"
-                        if stats.last_request_time > 0:
-                            last_request = datetime.fromtimestamp(stats.last_request_time).strftime("%H:%M:%S")
+                        slave_total = stats.total_requests
+                        slave_success_rate = (stats.successful_requests / slave_total * 100) if slave_total > 0 else 0
                         
-                        self.stats_tree.insert('', 'end', values=(
-                            slave_id, slave.name, stats.total_requests,
+                        rows[str(slave_id)] = (
+                            slave_id, slave.name, slave_total,
                             f"{slave_success_rate:.1f}%", stats.bytes_sent,
-                            stats.bytes_received, last_request
-                        ))
+                            stats.bytes_received, format_last_request(stats.last_request_time)
+                        )
+            
+            self._sync_tree(self.stats_tree, rows)
+            
+            # Recorded only once painted, so a failed refresh is retried on the next tick
+            self._last_stats_version = (server, version) if server else (None, -1)
                         
         except Exception as e:
             self.log_message(f"Statistics refresh error: {str(e)}")
@@ -714,19 +862,44 @@ class ModbusDiagnostics:
     def refresh_logs(self):
         """Refresh log display"""
         try:
-            # For now, just add a placeholder message
-            # In a real implementation, you would read from the log file
-            self.log_text.delete(1.0, tk.END)
-            self.log_text.insert(tk.END, "Log refresh functionality - would read from log file\n")
-            self.log_text.insert(tk.END, f"Current log level: {self.log_level_var.get()}\n")
-            self.log_text.insert(tk.END, f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            config = self.server.config if self.server else _DEFAULT_CONFIG
+            log_file = config['server']['log_file']
+            
+            # Only read what was appended since the last refresh, at most the last log_tail_bytes
+            st = os.stat(log_file)
+            if st.st_ino != self._log_file_inode or st.st_size < self._log_file_offset:
+                self._log_file_inode = st.st_ino
+                self._log_file_offset = max(0, st.st_size - self.log_tail_bytes)
+                self._log_skip_partial = self._log_file_offset > 0  # Landed mid-line; drop the fragment
+            
+            with open(log_file, 'rb') as f:
+                f.seek(self._log_file_offset)
+                data = f.read(st.st_size - self._log_file_offset)
+            
+            # Consume complete lines only; a partial last line is picked up next time
+            end = data.rfind(b'\n') + 1
+            start = 0
+            if self._log_skip_partial:
+                if not end:
+                    return  # Fragment not finished yet; keep skipping from the same offset
+                start = data.find(b'\n') + 1
+                self._log_skip_partial = False
+            self._log_file_offset += end
+            if end <= start:
+                return
+            
+            self._log_q.extend(data[start:end].decode('utf-8', errors='replace').splitlines(keepends=True))
+            if self._log_after_id is None:
+                self._log_after_id = self.root.after(100, self._flush_logs)
             
         except Exception as e:
             self.log_message(f"Log refresh error: {str(e)}")
     
     def clear_logs(self):
         """Clear log display"""
+        self._log_q.clear()
         self.log_text.delete(1.0, tk.END)
+        self._log_lines = 0
     
     def export_logs(self):
         """Export logs to file"""
@@ -737,8 +910,12 @@ class ModbusDiagnostics:
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
             if filename:
+                self._write_pending_logs()
+                # Copy the widget in line blocks rather than as one large string
+                last_line = int(self.log_text.index('end-1c').split('.')[0])
                 with open(filename, 'w') as f:
-                    f.write(self.log_text.get(1.0, tk.END))
+                    for line in range(1, last_line + 1, 1024):
+                        f.write(self.log_text.get(f"{line}.0", f"{line + 1024}.0"))
                 messagebox.showinfo("Success", f"Logs exported to {filename}")
                 
         except Exception as e:
@@ -747,11 +924,15 @@ class ModbusDiagnostics:
     def load_configuration(self):
         """Load configuration from file"""
         try:
-            with open("modbus_server_config.json", 'r') as f:
-                config = json.load(f)
+            # Re-read and re-format only when the file changed since the last load
+            mtime = os.stat("modbus_server_config.json").st_mtime_ns
+            if self._config_cache is None or self._config_cache[0] != mtime:
+                with open("modbus_server_config.json", 'rb') as f:
+                    config = _json_loads(f.read())
+                self._config_cache = (mtime, json.dumps(config, indent=4))
             
             self.config_text.delete(1.0, tk.END)
-            self.config_text.insert(1.0, json.dumps(config, indent=4))
+            self.config_text.insert(1.0, self._config_cache[1])
             
         except Exception as e:
             self.log_message(f"Configuration load error: {str(e)}")
@@ -760,10 +941,13 @@ class ModbusDiagnostics:
         """Save configuration to file"""
         try:
             config_str = self.config_text.get(1.0, tk.END)
-            config = json.loads(config_str)
+            _json_loads(config_str)  # Validate only; the text is saved as the user formatted it
             
-            with open("modbus_server_config.json", 'w') as f:
-                json.dump(config, f, indent=4)
+            # Write a sibling temp file and rename it over the config so a crash never leaves it half-written
+            tmp_path = "modbus_server_config.json.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(config_str)
+            os.replace(tmp_path, "modbus_server_config.json")
             
             messagebox.showinfo("Success", "Configuration saved successfully")
             self.log_message("Configuration saved")
@@ -776,41 +960,44 @@ class ModbusDiagnostics:
     def reset_configuration(self):
         """Reset configuration to defaults"""
         if messagebox.askyesno("Confirm", "Reset configuration to defaults?"):
-            default_config = {
-                "serial": {
-                    "port": "/dev/ttyUSB0",
-                    "baudrate": 9600,
-                    "bytesize": 8,
-                    "parity": "N",
-                    "stopbits": 1,
-                    "timeout": 1.0
-                },
-                "server": {
-                    "max_slaves": 10,
-                    "log_level": "INFO",
-                    "log_file": "/var/log/modbus_server.log",
-                    "stats_interval": 60,
-                    "backup_interval": 300
-                },
-                "performance": {
-                    "memory_check_interval": 30,
-                    "cpu_check_interval": 10,
-                    "auto_optimize": True
-                }
-            }
-            
             self.config_text.delete(1.0, tk.END)
-            self.config_text.insert(1.0, json.dumps(default_config, indent=4))
+            self.config_text.insert(1.0, _DEFAULT_CONFIG_JSON)
     
     def log_message(self, message: str):
-        """Add message to log display"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        self.log_text.insert(tk.END, log_entry)
+        """Queue message for the log display"""
+        self._log_q.append(f"[{self._strftime('%H:%M:%S', self._localtime())}] {message}\n")
+        if self._log_after_id is None:
+            self._log_after_id = self.root.after(100, self._flush_logs)
+    
+    def _write_pending_logs(self):
+        """Insert queued log lines in one call, trimming in log_trim_lines blocks"""
+        if not self._log_q:
+            return
+        
+        entries = ''.join(self._log_q)
+        self._log_q.clear()
+        self.log_text.insert(tk.END, entries)
+        self._log_lines += entries.count('\n')
+        
+        if self._log_lines > self.max_log_lines:
+            drop = self._log_lines - self.max_log_lines + self.log_trim_lines
+            self.log_text.delete(1.0, f"{drop + 1}.0")
+            self._log_lines -= drop
         self.log_text.see(tk.END)
     
+    def _flush_logs(self):
+        """Write out the messages queued since the flush was scheduled"""
+        self._log_after_id = None
+        try:
+            self._write_pending_logs()
+        except tk.TclError:
+            pass  # Widget gone during shutdown
+    
     def on_closing(self):
         """Handle window closing"""
+        if self._log_after_id is not None:
+            self.root.after_cancel(self._log_after_id)
+            self._log_after_id = None
         self.stop_monitoring()
         if self.server_running:
             self.stop_server()
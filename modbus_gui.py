@@ -3,7 +3,13 @@ from tkinter import ttk, messagebox, scrolledtext
 import serial
 import struct
 import threading
+import queue
 import time
+import collections
+import modbus_crc
+
+# bytes.translate table mapping everything outside printable ASCII to '.'
+_PRINT_TABLE = bytes(b if 0x20 <= b < 0x7F else ord('.') for b in range(256))
 
 class ModbusGUI:
     def __init__(self, root):
@@ -14,6 +20,8 @@ class ModbusGUI:
         # Serial connection
         self.ser = None
         self.is_connected = False
+        self._silent_interval = 0.0  # Seconds, set from the baud rate on connect
+        self._last_frame_end = 0.0
         
         self.create_widgets()
         
@@ -144,29 +152,64 @@ class ModbusGUI:
         results_frame.rowconfigure(0, weight=1)
         
         # Results text area
-        self.results_text = scrolledtext.ScrolledText(results_frame, height=15, width=80)
+        # Append-only log: no undo stack or edit separators to maintain per insert
+        self.results_text = scrolledtext.ScrolledText(results_frame, height=15, width=80,
+                                                      undo=False, autoseparators=False)
         self.results_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Clear button
         clear_btn = ttk.Button(results_frame, text="Clear Results", command=self.clear_results)
         clear_btn.grid(row=1, column=0, pady=(5, 0))
         
-        # Continuous reading variables
+        # Integer entry values, parsed once per edit instead of on every read (None while invalid)
+        self._params = {}
+        for name, var in (('slave_id', self.slave_id_var), ('start_address', self.start_addr_var),
+                          ('num_registers', self.num_regs_var), ('file_number', self.file_number_var),
+                          ('record_number', self.record_number_var), ('record_length', self.record_length_var)):
+            self._update_param(name, var)
+            var.trace_add('write', lambda *_, name=name, var=var: self._update_param(name, var))
+        
+        # Continuous reading: one long-lived worker takes start/stop commands and
+        # posts log lines back, which the Tk side drains every 50 ms; a None entry
+        # means the worker stopped on its own
         self.continuous_reading = False
-        self.continuous_thread = None
-        
+        self.continuous_period = 1.0  # Seconds between continuous read starts
+        self._cmd_q = queue.Queue()
+        self._result_q = queue.Queue()
+        self.continuous_thread = threading.Thread(target=self.continuous_read_worker, daemon=True)
+        self.continuous_thread.start()
+        self.root.after(50, self._poll_results)
+        
+        # Complete read-holding-registers frames (with CRC) keyed by (slave_id, start_address, num_registers)
+        self._req_cache = {}
+        
+        # Result lines are buffered and written to the text area in 50 ms batches
+        self.max_result_lines = 5000
+        self._log_buf = collections.deque()
+        self._log_scheduled = False
+        self._tk_thread = threading.get_ident()  # log_message reroutes calls from other threads
+        
+    def _update_param(self, name, var):
+        """Re-parse one integer entry after the user edits it"""
+        try:
+            self._params[name] = int(var.get())
+        except ValueError:
+            self._params[name] = None
+    
+    def _param(self, name):
+        """Return a parsed entry value, raising ValueError like int() if the entry is invalid"""
+        value = self._params[name]
+        if value is None:
+            raise ValueError(f"invalid {name}")
+        return value
+    
     def calculate_crc(self, data):
         """Calculate CRC-16 Modbus"""
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if (crc & 0x0001):
-                    crc >>= 1
-                    crc ^= 0xA001
-                else:
-                    crc >>= 1
-        return crc.to_bytes(2, 'little')
+        return modbus_crc.calculate_crc(data)
+    
+    def _crc_ok(self, frame):
+        """Validate a received frame including its trailing CRC in a single pass"""
+        return modbus_crc.crc_ok(frame)
     
     def connect_serial(self):
         """Connect to serial port"""
@@ -184,6 +227,9 @@ class ModbusGUI:
                 timeout=timeout
             )
             
+            # Modbus RTU inter-frame gap: 3.5 character times of 11 bits each
+            self._silent_interval = 3.5 * 11 / baudrate
+            
             self.is_connected = True
             self.status_var.set("Connected")
             self.connect_btn.config(state=tk.DISABLED)
@@ -224,58 +270,118 @@ class ModbusGUI:
         except Exception as e:
             messagebox.showerror("Disconnection Error", f"Failed to disconnect: {str(e)}")
     
-    def read_holding_registers_raw(self, slave_id, start_address, num_registers):
-        """Read holding registers from Modbus device"""
+    def _build_read_holding_request(self, slave_id, start_address, num_registers):
+        """Return the 0x03 request frame, building it and its CRC only on first use"""
+        key = (slave_id, start_address, num_registers)
+        frame = self._req_cache.get(key)
+        if frame is None:
+            request_data = struct.pack('>BBHH', slave_id, 0x03, start_address, num_registers)
+            frame = request_data + self.calculate_crc(request_data)
+            if len(self._req_cache) >= 64:
+                self._req_cache.clear()
+            self._req_cache[key] = frame
+        return frame
+    
+    def _send_request(self, frame):
+        """Send a request frame after discarding stale input and honouring the RTU silent interval"""
+        gap = self._silent_interval - (time.monotonic() - self._last_frame_end)
+        if gap > 0:
+            time.sleep(gap)
+        self.ser.reset_input_buffer()
+        self.ser.write(frame)
+    
+    def _read_response(self):
+        """Read one response frame: header first, then exactly the bytes it announces"""
+        try:
+            header = self.ser.read(3)
+            if len(header) < 3:
+                self.log_message("Incomplete response received")
+                return None
+            
+            if header[1] & 0x80:
+                # Exception response: [Slave ID][Function | 0x80][Exception Code][CRC]
+                frame = header + self.ser.read(2)
+                if len(frame) < 5 or not self._crc_ok(frame):
+                    self.log_message("Invalid exception response received")
+                else:
+                    self.log_message(f"Modbus exception 0x{frame[2]:02X} from slave {frame[0]} "
+                                     f"(function 0x{frame[1] & 0x7F:02X})")
+                return None
+            
+            # Normal response: header[2] is the byte count of the data that follows
+            remaining = header[2] + 2
+            body = self.ser.read(remaining)
+            if len(body) < remaining:
+                self.log_message("Incomplete response data received")
+                return None
+            return header + body
+        finally:
+            self._last_frame_end = time.monotonic()
+    
+    def _read_holding_frame(self, slave_id, start_address, num_registers):
+        """Run a read-holding-registers transaction and return the validated response frame"""
         if not self.is_connected or not self.ser:
             return None
         
         try:
-            # Construct the Modbus RTU request frame
-            request_data = bytes([slave_id, 0x03, (start_address >> 8) & 0xFF, start_address & 0xFF,
-                                  (num_registers >> 8) & 0xFF, num_registers & 0xFF])
-            crc = self.calculate_crc(request_data)
-            full_request = request_data + crc
-
-            self.ser.write(full_request)
-            response = self.ser.read(3 + num_registers * 2 + 2)
+            # Modbus RTU request frame, reused across repeated polls
+            full_request = self._build_read_holding_request(slave_id, start_address, num_registers)
 
-            if len(response) < (3 + num_registers * 2 + 2):
-                self.log_message("Incomplete response received")
+            self._send_request(full_request)
+            response = self._read_response()
+            if response is None:
+                return None
+            
+            if response[2] != num_registers * 2:
+                self.log_message("Unexpected response length")
                 return None
 
             # Validate CRC
-            received_crc = response[-2:]
-            calculated_crc = self.calculate_crc(response[:-2])
-
-            if received_crc != calculated_crc:
+            if not self._crc_ok(response):
                 self.log_message("CRC mismatch!")
                 return None
 
-            # Extract register values
-            registers = []
-            for i in range(num_registers):
-                value = (response[3 + i * 2] << 8) | response[4 + i * 2]
-                registers.append(value)
-            return registers
+            return response
             
         except Exception as e:
             self.log_message(f"Error reading registers: {str(e)}")
             return None
     
+    def read_holding_registers_raw(self, slave_id, start_address, num_registers):
+        """Read holding registers from Modbus device"""
+        response = self._read_holding_frame(slave_id, start_address, num_registers)
+        if response is None:
+            return None
+        
+        # Extract register values
+        return list(struct.unpack_from(f'>{num_registers}H', response, 3))
+    
+    def _frame_float(self, response):
+        """Decode the float in a two-register response (low word first, big-endian words)"""
+        return struct.unpack('>f', response[5:7] + response[3:5])[0]
+    
+    def read_float_raw(self, slave_id, start_address):
+        """Read a float from two consecutive registers straight from the response bytes"""
+        response = self._read_holding_frame(slave_id, start_address, 2)
+        if response is None:
+            return None
+        return self._frame_float(response)
+    
     def read_holding_registers(self):
         """Read holding registers and display results"""
         try:
-            slave_id = int(self.slave_id_var.get())
-            start_address = int(self.start_addr_var.get())
-            num_registers = int(self.num_regs_var.get())
+            slave_id = self._param('slave_id')
+            start_address = self._param('start_address')
+            num_registers = self._param('num_registers')
             
             registers = self.read_holding_registers_raw(slave_id, start_address, num_registers)
             
             if registers:
                 timestamp = time.strftime("%H:%M:%S")
-                self.log_message(f"[{timestamp}] Read {num_registers} registers from address {start_address}:")
-                for i, value in enumerate(registers):
-                    self.log_message(f"  Register {start_address + i}: {value} (0x{value:04X})")
+                lines = [f"[{timestamp}] Read {num_registers} registers from address {start_address}:"]
+                lines.extend(f"  Register {start_address + i}: {value} (0x{value:04X})"
+                             for i, value in enumerate(registers))
+                self.log_message('\n'.join(lines))
             else:
                 self.log_message("Failed to read holding registers")
                 
@@ -287,16 +393,14 @@ class ModbusGUI:
     def read_float_value(self):
         """Read floating point value from two consecutive registers"""
         try:
-            slave_id = int(self.slave_id_var.get())
-            start_address = int(self.start_addr_var.get())
+            slave_id = self._param('slave_id')
+            start_address = self._param('start_address')
             
-            registers_raw = self.read_holding_registers_raw(slave_id, start_address, 2)
+            response = self._read_holding_frame(slave_id, start_address, 2)
             
-            if registers_raw and len(registers_raw) >= 2:
-                # Pack the two 16-bit integers into a 32-bit binary string (little-endian word order)
-                packed_data = struct.pack('<HH', registers_raw[0], registers_raw[1])
-                # Unpack the binary string into a float
-                float_value = struct.unpack('<f', packed_data)[0]
+            if response is not None:
+                float_value = self._frame_float(response)
+                registers_raw = struct.unpack_from('>HH', response, 3)
                 
                 timestamp = time.strftime("%H:%M:%S")
                 self.log_message(f"[{timestamp}] Float value from address {start_address}: {float_value:.6f}")
@@ -313,36 +417,80 @@ class ModbusGUI:
         """Toggle continuous reading mode"""
         if not self.continuous_reading:
             self.continuous_reading = True
+            self._cmd_q.put('start')
             self.continuous_btn.config(text="Stop Continuous Read")
-            self.continuous_thread = threading.Thread(target=self.continuous_read_worker, daemon=True)
-            self.continuous_thread.start()
             self.log_message("Started continuous reading...")
         else:
             self.continuous_reading = False
+            self._cmd_q.put('stop')
             self.continuous_btn.config(text="Start Continuous Read")
             self.log_message("Stopped continuous reading")
     
     def continuous_read_worker(self):
-        """Worker thread for continuous reading"""
-        while self.continuous_reading and self.is_connected:
+        """Long-lived worker thread for continuous reading"""
+        # Reads start on a fixed schedule, so the time spent on the serial round-trip
+        # comes out of the wait instead of being added to it; the wait itself is the
+        # command queue, so a stop is picked up immediately
+        running = False
+        next_read = 0.0
+        while True:
+            timeout = max(0.0, next_read - time.monotonic()) if running else None
             try:
-                slave_id = int(self.slave_id_var.get())
-                start_address = int(self.start_addr_var.get())
+                command = self._cmd_q.get(timeout=timeout)
+            except queue.Empty:
+                command = None
+            
+            if command == 'start':
+                running = True
+                next_read = time.monotonic()
+                continue
+            if command == 'stop' or not running:
+                running = False
+                continue
+            if not self.is_connected:
+                running = False
+                self._result_q.put(None)
+                continue
+            
+            try:
+                slave_id = self._param('slave_id')
+                start_address = self._param('start_address')
                 
-                registers_raw = self.read_holding_registers_raw(slave_id, start_address, 2)
+                float_value = self.read_float_raw(slave_id, start_address)
                 
-                if registers_raw and len(registers_raw) >= 2:
-                    packed_data = struct.pack('<HH', registers_raw[0], registers_raw[1])
-                    float_value = struct.unpack('<f', packed_data)[0]
-                    
+                if float_value is not None:
                     timestamp = time.strftime("%H:%M:%S")
-                    self.root.after(0, lambda: self.log_message(f"[{timestamp}] Continuous: {float_value:.6f}"))
-                
-                time.sleep(1)  # Read every second
+                    self._result_q.put(f"[{timestamp}] Continuous: {float_value:.6f}")
                 
             except Exception as e:
-                self.root.after(0, lambda: self.log_message(f"Continuous read error: {str(e)}"))
+                self._result_q.put(f"Continuous read error: {str(e)}")
+                self._result_q.put(None)
+                running = False
+                continue
+            
+            next_read += self.continuous_period
+            if next_read < time.monotonic():
+                next_read = time.monotonic()  # Fell behind; don't burst to catch up
+    
+    def _poll_results(self):
+        """Move lines posted by the continuous worker into the results log"""
+        while True:
+            try:
+                message = self._result_q.get_nowait()
+            except queue.Empty:
                 break
+            if message is None:
+                self._continuous_stopped()
+            else:
+                self.log_message(message)
+        self.root.after(50, self._poll_results)
+    
+    def _continuous_stopped(self):
+        """Reset the toggle after the worker ended continuous reading by itself"""
+        if self.continuous_reading:
+            self.continuous_reading = False
+            self.continuous_btn.config(text="Start Continuous Read")
+            self.log_message("Stopped continuous reading")
     
     def read_file_records_raw(self, slave_id, file_number, record_number, record_length):
         """Read file records using Modbus function code 14h (0x14)"""
@@ -355,43 +503,28 @@ class ModbusGUI:
             byte_count = 7  # Reference Type (1) + File Number (2) + Record Number (2) + Record Length (2)
             reference_type = 6  # Standard reference type for file records
             
-            request_data = bytes([
+            request_data = struct.pack(
+                '>BBBBHHH',
                 slave_id,
                 0x14,  # Function code 14h (Read File Record)
                 byte_count,
                 reference_type,
-                (file_number >> 8) & 0xFF, file_number & 0xFF,
-                (record_number >> 8) & 0xFF, record_number & 0xFF,
-                (record_length >> 8) & 0xFF, record_length & 0xFF
-            ])
+                file_number,
+                record_number,
+                record_length
+            )
             
             crc = self.calculate_crc(request_data)
             full_request = request_data + crc
             
-            # Send request
-            self.ser.write(full_request)
-            
-            # Read response header first (Slave ID + Function Code + Response Data Length)
-            header_response = self.ser.read(3)
-            if len(header_response) < 3:
-                self.log_message("Incomplete header response received")
+            # Send request and read the header-sized response
+            self._send_request(full_request)
+            full_response = self._read_response()
+            if full_response is None:
                 return None
             
-            response_data_length = header_response[2]
-            
-            # Read the rest of the response (data + CRC)
-            remaining_response = self.ser.read(response_data_length + 2)
-            if len(remaining_response) < (response_data_length + 2):
-                self.log_message("Incomplete response data received")
-                return None
-            
-            full_response = header_response + remaining_response
-            
             # Validate CRC
-            received_crc = full_response[-2:]
-            calculated_crc = self.calculate_crc(full_response[:-2])
-            
-            if received_crc != calculated_crc:
+            if not self._crc_ok(full_response):
                 self.log_message("CRC mismatch in file record response!")
                 return None
             
@@ -429,33 +562,33 @@ class ModbusGUI:
     def read_file_records(self):
         """Read file records and display results as hex data"""
         try:
-            slave_id = int(self.slave_id_var.get())
-            file_number = int(self.file_number_var.get())
-            record_number = int(self.record_number_var.get())
-            record_length = int(self.record_length_var.get())
+            slave_id = self._param('slave_id')
+            file_number = self._param('file_number')
+            record_number = self._param('record_number')
+            record_length = self._param('record_length')
             
             result = self.read_file_records_raw(slave_id, file_number, record_number, record_length)
             
             if result:
                 timestamp = time.strftime("%H:%M:%S")
-                self.log_message(f"[{timestamp}] File Record Read (Function 14h):")
-                self.log_message(f"  File Number: {result['file_number']}")
-                self.log_message(f"  Record Number: {result['record_number']}")
-                self.log_message(f"  Record Length: {result['record_length']}")
-                self.log_message(f"  Reference Type: {result['reference_type']}")
-                self.log_message(f"  Data Length: {len(result['data'])} bytes")
-                
-                # Display data as hex
-                hex_data = ' '.join([f"{byte:02X}" for byte in result['data']])
-                self.log_message(f"  Hex Data: {hex_data}")
+                lines = [
+                    f"[{timestamp}] File Record Read (Function 14h):",
+                    f"  File Number: {result['file_number']}",
+                    f"  Record Number: {result['record_number']}",
+                    f"  Record Length: {result['record_length']}",
+                    f"  Reference Type: {result['reference_type']}",
+                    f"  Data Length: {len(result['data'])} bytes",
+                    # Display data as hex
+                    f"  Hex Data: {result['data'].hex(' ').upper()}",
+                ]
                 
                 # Display data as 16-bit words (big-endian)
                 if len(result['data']) >= 2:
-                    words = []
-                    for i in range(0, len(result['data']) - 1, 2):
-                        word = (result['data'][i] << 8) | result['data'][i + 1]
-                        words.append(word)
-                    self.log_message(f"  Words: {words}")
+                    word_count = len(result['data']) // 2
+                    words = list(struct.unpack_from(f'>{word_count}H', result['data']))
+                    lines.append(f"  Words: {words}")
+                
+                self.log_message('\n'.join(lines))
                 
             else:
                 self.log_message("Failed to read file records")
@@ -468,34 +601,36 @@ class ModbusGUI:
     def read_file_as_text(self):
         """Read file records and display results as text"""
         try:
-            slave_id = int(self.slave_id_var.get())
-            file_number = int(self.file_number_var.get())
-            record_number = int(self.record_number_var.get())
-            record_length = int(self.record_length_var.get())
+            slave_id = self._param('slave_id')
+            file_number = self._param('file_number')
+            record_number = self._param('record_number')
+            record_length = self._param('record_length')
             
             result = self.read_file_records_raw(slave_id, file_number, record_number, record_length)
             
             if result:
                 timestamp = time.strftime("%H:%M:%S")
-                self.log_message(f"[{timestamp}] File Record as Text (Function 14h):")
-                self.log_message(f"  File Number: {result['file_number']}")
-                self.log_message(f"  Record Number: {result['record_number']}")
-                self.log_message(f"  Record Length: {result['record_length']}")
+                lines = [
+                    f"[{timestamp}] File Record as Text (Function 14h):",
+                    f"  File Number: {result['file_number']}",
+                    f"  Record Number: {result['record_number']}",
+                    f"  Record Length: {result['record_length']}",
+                ]
                 
                 # Try to decode as ASCII text
                 try:
-                    text_data = result['data'].decode('ascii', errors='replace')
-                    # Remove null characters and non-printable characters for cleaner display
-                    clean_text = ''.join(char if char.isprintable() else '.' for char in text_data)
-                    self.log_message(f"  Text Data: '{clean_text}'")
+                    # Replace null and non-printable bytes with '.' for cleaner display
+                    clean_text = result['data'].translate(_PRINT_TABLE).decode('ascii')
+                    lines.append(f"  Text Data: '{clean_text}'")
                 except Exception as decode_error:
-                    self.log_message(f"  Text decode error: {str(decode_error)}")
+                    lines.append(f"  Text decode error: {str(decode_error)}")
                     # Fallback to hex display
-                    hex_data = ' '.join([f"{byte:02X}" for byte in result['data']])
-                    self.log_message(f"  Hex Data: {hex_data}")
+                    lines.append(f"  Hex Data: {result['data'].hex(' ').upper()}")
                 
                 # Also show raw bytes for reference
-                self.log_message(f"  Raw bytes: {list(result['data'])}")
+                lines.append(f"  Raw bytes: {list(result['data'])}")
+                
+                self.log_message('\n'.join(lines))
                 
             else:
                 self.log_message("Failed to read file records as text")
@@ -506,12 +641,35 @@ class ModbusGUI:
             messagebox.showerror("Read Error", f"Error reading file records as text: {str(e)}")
     
     def log_message(self, message):
-        """Add message to results text area"""
-        self.results_text.insert(tk.END, message + "\n")
-        self.results_text.see(tk.END)
+        """Queue message for the results text area"""
+        if threading.get_ident() != self._tk_thread:
+            # Called from the continuous worker: Tk and _log_buf are only touched on the Tk thread
+            self._result_q.put(message)
+            return
+        self._log_buf.append(message + "\n")
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self.root.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Write buffered messages with one insert and keep the last max_result_lines"""
+        self._log_scheduled = False
+        if not self._log_buf:
+            return
+        
+        text = ''.join(self._log_buf)
+        self._log_buf.clear()
+        
+        # Only follow new output if the user hasn't scrolled up to read older lines
+        at_bottom = self.results_text.yview()[1] > 0.999
+        self.results_text.insert(tk.END, text)
+        self.results_text.delete(1.0, f"end-{self.max_result_lines} lines")
+        if at_bottom:
+            self.results_text.see(tk.END)
     
     def clear_results(self):
         """Clear the results text area"""
+        self._log_buf.clear()
         self.results_text.delete(1.0, tk.END)
     
     def on_closing(self):
@@ -20,20 +20,19 @@ import threading
 import time
 import json
 import logging
-import queue
 import signal
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 import psutil
 import os
+import modbus_crc
 
 # Configuration for Pi Zero 2W optimization
 PI_ZERO_CONFIG = {
-    'max_threads': 4,  # Quad-core ARM Cortex-A53
     'memory_limit_mb': 400,  # Leave 112MB for system
     'cpu_threshold': 80,  # CPU usage threshold
     'max_connections': 10,  # Concurrent connections
@@ -42,13 +41,57 @@ PI_ZERO_CONFIG = {
     'reconnect_delay': 2.0,  # Reconnection delay
 }
 
-@dataclass
+# Request frame length by function code: either a fixed size, or
+# (index of the byte count, bytes in the frame besides the counted data)
+_REQUEST_LENGTH = {
+    0x01: 8, 0x02: 8, 0x03: 8, 0x04: 8, 0x05: 8, 0x06: 8,  # slave_id + function_code + 4 data + 2 CRC
+    0x0F: (6, 9), 0x10: (6, 9),  # address(2) + quantity(2) + byte_count precede the data
+    0x14: (2, 5),  # byte_count follows the function code
+}
+
+# Big-endian request fields: address + quantity/value, and file + record number + record length
+_ADDR_QTY = struct.Struct('>HH')
+_FILE_RECORD_REQUEST = struct.Struct('>HHH')
+
+@lru_cache(maxsize=None)
+def _register_response(quantity: int) -> struct.Struct:
+    """Struct for a register read response: slave id, function code, byte count, then the registers"""
+    return struct.Struct(f'>BBB{quantity}H')
+
+@lru_cache(maxsize=None)
+def _register_values(quantity: int) -> struct.Struct:
+    """Struct for a run of big-endian registers, as carried by write multiple registers"""
+    return struct.Struct(f'>{quantity}H')
+
+def _pack_bits(bits: Dict[int, bool], start_address: int, quantity: int) -> bytes:
+    """Pack a coil/discrete input range LSB first, missing addresses read as off"""
+    end_address = start_address + quantity
+    # Walk whichever is smaller: the configured addresses or the requested range.
+    # The key snapshot keeps inserts from the web/diagnostics threads from breaking the walk.
+    if len(bits) < quantity:
+        addresses = [addr for addr in tuple(bits) if start_address <= addr < end_address]
+    else:
+        addresses = range(start_address, end_address)
+    value = 0
+    for addr in addresses:
+        if bits.get(addr):
+            value |= 1 << (addr - start_address)
+    return value.to_bytes((quantity + 7) // 8, 'little')
+
 class ModbusRegister:
     """Modbus register data structure"""
-    address: int
-    value: int
-    timestamp: float
-    quality: str = "GOOD"  # GOOD, BAD, UNCERTAIN
+    
+    __slots__ = ('address', 'value', 'timestamp', 'quality')
+    
+    def __init__(self, address: int, value: int, timestamp: float, quality: str = "GOOD"):
+        self.address = address
+        self.value = value
+        self.timestamp = timestamp
+        self.quality = quality  # GOOD, BAD, UNCERTAIN
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the register as a plain dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 @dataclass
 class SlaveConfig:
@@ -62,16 +105,26 @@ class SlaveConfig:
     discrete_inputs: Dict[int, bool]
     file_records: Dict[int, Dict[int, bytes]]
 
-@dataclass
 class ConnectionStats:
     """Connection statistics"""
-    total_requests: int = 0
-    successful_requests: int = 0
-    failed_requests: int = 0
-    last_request_time: float = 0
-    connection_uptime: float = 0
-    bytes_sent: int = 0
-    bytes_received: int = 0
+    
+    __slots__ = ('total_requests', 'successful_requests', 'failed_requests', 'last_request_time',
+                 'connection_uptime', 'bytes_sent', 'bytes_received')
+    
+    def __init__(self, total_requests: int = 0, successful_requests: int = 0, failed_requests: int = 0,
+                 last_request_time: float = 0, connection_uptime: float = 0,
+                 bytes_sent: int = 0, bytes_received: int = 0):
+        self.total_requests = total_requests
+        self.successful_requests = successful_requests
+        self.failed_requests = failed_requests
+        self.last_request_time = last_request_time
+        self.connection_uptime = connection_uptime
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a plain dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 class ModbusIndustrialServer:
     """Industrial Modbus RTU Server optimized for Raspberry Pi Zero 2W"""
@@ -79,23 +132,39 @@ class ModbusIndustrialServer:
     def __init__(self, config_file: str = "modbus_server_config.json"):
         self.config_file = config_file
         self.config = self._load_config()
+        self._max_slaves = self.config['server']['max_slaves']
         self.slaves: Dict[int, SlaveConfig] = {}
         self.stats: Dict[int, ConnectionStats] = {}
+        self.total_requests = 0  # Running sum of total_requests over self.stats
+        self.stats_version = 0  # Bumped on every change to self.stats, for cheap change detection
+        self._stats_lock = threading.Lock()  # Guards self.stats, total_requests and stats_version
         
         # Serial connection
         self.serial_port: Optional[serial.Serial] = None
         self.is_running = False
         self.server_thread: Optional[threading.Thread] = None
-        
-        # Thread management
-        self.executor = ThreadPoolExecutor(max_workers=PI_ZERO_CONFIG['max_threads'])
-        self.request_queue = queue.Queue(maxsize=100)
+        self._rx_buf = bytearray()  # Received bytes not yet framed
+        
+        # Request handlers by function code
+        self._dispatch = {
+            0x01: self._handle_read_coils,
+            0x02: self._handle_read_discrete_inputs,
+            0x03: self._handle_read_holding_registers,
+            0x04: self._handle_read_input_registers,
+            0x05: self._handle_write_single_coil,
+            0x06: self._handle_write_single_register,
+            0x0F: self._handle_write_multiple_coils,
+            0x10: self._handle_write_multiple_registers,
+            0x14: self._handle_read_file_records,
+        }
         
         # Logging setup
         self._setup_logging()
         
         # Performance monitoring
-        self.performance_monitor = PerformanceMonitor()
+        performance_config = self.config['performance']
+        self.performance_monitor = PerformanceMonitor(performance_config['cpu_check_interval'],
+                                                      performance_config['memory_check_interval'])
         
         # Signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -158,27 +227,25 @@ class ModbusIndustrialServer:
         # Create log directory if it doesn't exist
         Path(log_file).parent.mkdir(parents=True, exist_ok=True)
         
-        # Configure logging
-        logging.basicConfig(
-            level=log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        # Configure logging; a no-op if the host process (e.g. the web server) already did
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        logging.basicConfig(level=log_level, handlers=[console_handler])
         
-        self.logger = logging.getLogger('ModbusServer')
-        
-        # Add rotation to prevent log files from growing too large
+        # Add rotation to prevent log files from growing too large. Attached to the root
+        # logger so PerformanceMonitor records reach the file too, and only once per file
+        # so a second server instance doesn't write every record twice.
         from logging.handlers import RotatingFileHandler
-        file_handler = RotatingFileHandler(
-            log_file, maxBytes=10*1024*1024, backupCount=5
-        )
-        file_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        )
-        self.logger.addHandler(file_handler)
+        root_logger = logging.getLogger()
+        log_path = os.path.abspath(log_file)
+        if not any(isinstance(handler, RotatingFileHandler) and handler.baseFilename == log_path
+                   for handler in root_logger.handlers):
+            file_handler = RotatingFileHandler(log_file, maxBytes=10*1024*1024, backupCount=5)
+            file_handler.setFormatter(formatter)
+            root_logger.addHandler(file_handler)
+        
+        self.logger = logging.getLogger('ModbusServer')
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
@@ -188,34 +255,54 @@ class ModbusIndustrialServer:
     
     def add_slave(self, slave_config: SlaveConfig):
         """Add a slave device to the server"""
-        if len(self.slaves) >= self.config['server']['max_slaves']:
-            raise ValueError(f"Maximum number of slaves ({self.config['server']['max_slaves']}) reached")
-        
-        self.slaves[slave_config.slave_id] = slave_config
-        self.stats[slave_config.slave_id] = ConnectionStats()
+        if len(self.slaves) >= self._max_slaves:
+            raise ValueError(f"Maximum number of slaves ({self._max_slaves}) reached")
+        
+        with self._stats_lock:
+            if slave_config.slave_id in self.stats:
+                self.total_requests -= self.stats[slave_config.slave_id].total_requests
+            self.slaves[slave_config.slave_id] = slave_config
+            self.stats[slave_config.slave_id] = ConnectionStats()
+            self.stats_version += 1
         self.logger.info(f"Added slave {slave_config.slave_id}: {slave_config.name}")
     
     def remove_slave(self, slave_id: int):
         """Remove a slave device from the server"""
-        if slave_id in self.slaves:
+        with self._stats_lock:
+            if slave_id not in self.slaves:
+                return
             del self.slaves[slave_id]
-            del self.stats[slave_id]
-            self.logger.info(f"Removed slave {slave_id}")
+            self.total_requests -= self.stats.pop(slave_id).total_requests
+            self.stats_version += 1
+        self.logger.info(f"Removed slave {slave_id}")
     
     def start_server(self):
         """Start the Modbus server"""
+        if self._start_services():
+            # Start server thread
+            self.server_thread = threading.Thread(target=self._server_loop, daemon=True)
+            self.server_thread.start()
+    
+    def run_forever(self):
+        """Start the server and serve requests on the calling thread until it is stopped"""
+        # RTU answers one frame at a time, so the serial loop gains nothing from its own thread
+        if not self._start_services():
+            return
+        try:
+            self._server_loop()
+        finally:
+            self.stop_server()
+    
+    def _start_services(self) -> bool:
+        """Open the port and start background monitoring; False if the server is already running"""
         if self.is_running:
             self.logger.warning("Server is already running")
-            return
+            return False
         
         try:
             # Open serial connection
             self._connect_serial()
-            
-            # Start server thread
             self.is_running = True
-            self.server_thread = threading.Thread(target=self._server_loop, daemon=True)
-            self.server_thread.start()
             
             # Start performance monitoring
             self.performance_monitor.start()
@@ -224,6 +311,7 @@ class ModbusIndustrialServer:
             self._start_stats_reporting()
             
             self.logger.info("Modbus Industrial Server started successfully")
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to start server: {e}")
@@ -245,9 +333,6 @@ class ModbusIndustrialServer:
         if self.serial_port and self.serial_port.is_open:
             self.serial_port.close()
         
-        # Shutdown thread pool
-        self.executor.shutdown(wait=True)
-        
         # Wait for server thread to finish
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=5)
@@ -294,69 +379,79 @@ class ModbusIndustrialServer:
                     self._connect_serial()
                     continue
                 
-                # Check for incoming requests
-                if self.serial_port.in_waiting > 0:
-                    request_data = self._read_request()
-                    if request_data:
-                        # Process request in thread pool
-                        future = self.executor.submit(self._process_request, request_data)
-                        # Don't wait for completion to maintain responsiveness
-                
-                # Small delay to prevent CPU spinning
-                time.sleep(0.001)  # 1ms
+                # Blocking read on the port timeout, so the loop sleeps in the kernel while idle
+                request_data = self._read_request()
+                if request_data:
+                    # RTU is half-duplex: answer on this thread before reading the next frame
+                    self._process_request(request_data)
                 
+            except (serial.SerialException, OSError) as e:
+                if not self.is_running:
+                    break  # stop_server closed the port under a blocking read
+                # Dead or unplugged adapter: close it so the next pass reconnects
+                self.logger.error("Serial error in server loop: %s", e)
+                self._close_serial()
+                time.sleep(1)
             except Exception as e:
                 self.logger.error(f"Error in server loop: {e}")
                 time.sleep(1)  # Longer delay on error
     
+    def _close_serial(self):
+        """Close the serial port after a failure and drop any partially received frame"""
+        self._rx_buf.clear()
+        try:
+            if self.serial_port:
+                self.serial_port.close()
+        except Exception as e:
+            self.logger.debug("Error closing serial port: %s", e)
+    
     def _read_request(self) -> Optional[bytes]:
-        """Read a complete Modbus request from serial port"""
+        """Read a complete Modbus request from serial port; port errors propagate to _server_loop"""
+        # A previous read may already have buffered the next frame
+        frame = self._take_frame()
+        if frame:
+            return frame
+        
+        # Read whatever has arrived in one call; blocks up to the port timeout when idle
+        chunk = self.serial_port.read(self.serial_port.in_waiting or 1)
+        if not chunk:
+            # Line went quiet mid-frame: drop the partial frame so the next one starts clean
+            self._rx_buf.clear()
+            return None
+        
+        self._rx_buf += chunk
+        return self._take_frame()
+    
+    def _take_frame(self) -> Optional[bytes]:
+        """Pop one complete request off the receive buffer, or None if it is still incomplete"""
+        buf = self._rx_buf
+        if len(buf) < 2:
+            return None
+        
         try:
-            # Read minimum frame (slave_id + function_code)
-            header = self.serial_port.read(2)
-            if len(header) < 2:
+            length = _REQUEST_LENGTH.get(buf[1])
+            if length is None:
+                self.logger.warning("Unsupported function code: 0x%02X", buf[1])
+                buf.clear()
                 return None
             
-            slave_id, function_code = header
-            
-            # Determine expected frame length based on function code
-            if function_code in [0x01, 0x02, 0x03, 0x04, 0x05, 0x06]:
-                # Standard functions - read remaining 6 bytes (4 data + 2 CRC)
-                remaining = self.serial_port.read(6)
-                if len(remaining) < 6:
+            if isinstance(length, tuple):
+                count_index, overhead = length
+                if len(buf) <= count_index:
                     return None
-                return header + remaining
+                length = overhead + buf[count_index]
             
-            elif function_code == 0x0F or function_code == 0x10:
-                # Write multiple - need to read byte count first
-                byte_count_data = self.serial_port.read(4)  # address(2) + quantity(2)
-                if len(byte_count_data) < 4:
-                    return None
-                
-                if function_code == 0x0F:
-                    # Write multiple coils
-                    byte_count = self.serial_port.read(1)[0]
-                    data = self.serial_port.read(byte_count + 2)  # data + CRC
-                else:
-                    # Write multiple registers
-                    byte_count = self.serial_port.read(1)[0]
-                    data = self.serial_port.read(byte_count + 2)  # data + CRC
-                
-                return header + byte_count_data + bytes([byte_count]) + data
-            
-            elif function_code == 0x14:
-                # Read file records
-                byte_count = self.serial_port.read(1)[0]
-                remaining = self.serial_port.read(byte_count + 2)  # data + CRC
-                return header + bytes([byte_count]) + remaining
-            
-            else:
-                self.logger.warning(f"Unsupported function code: 0x{function_code:02X}")
+            if len(buf) < length:
                 return None
-                
-        except Exception as e:
-            self.logger.error(f"Error reading request: {e}")
+        except (IndexError, ValueError) as e:
+            # Framing errors only; serial port errors are handled by _server_loop
+            self.logger.error("Error framing request: %s", e)
+            buf.clear()
             return None
+        
+        frame = bytes(buf[:length])
+        del buf[:length]
+        return frame
     
     def _process_request(self, request_data: bytes):
         """Process a Modbus request"""
@@ -367,11 +462,16 @@ class ModbusIndustrialServer:
             slave_id = request_data[0]
             function_code = request_data[1]
             
-            # Update statistics
-            if slave_id in self.stats:
-                self.stats[slave_id].total_requests += 1
-                self.stats[slave_id].last_request_time = time.time()
-                self.stats[slave_id].bytes_received += len(request_data)
+            # Update statistics; the lookup and the running total change together so a
+            # concurrent add/remove_slave can't leave total_requests out of step
+            with self._stats_lock:
+                stats = self.stats.get(slave_id)
+                if stats is not None:
+                    self.total_requests += 1
+                    stats.total_requests += 1
+                    stats.last_request_time = time.time()
+                    stats.bytes_received += len(request_data)
+                    self.stats_version += 1
             
             # Check if slave exists
             if slave_id not in self.slaves:
@@ -380,44 +480,30 @@ class ModbusIndustrialServer:
             
             # Validate CRC
             if not self._validate_crc(request_data):
-                self.logger.warning(f"CRC validation failed for slave {slave_id}")
+                self.logger.warning("CRC validation failed for slave %s", slave_id)
                 return
             
             # Process based on function code
-            response = None
-            if function_code == 0x03:  # Read Holding Registers
-                response = self._handle_read_holding_registers(slave_id, request_data)
-            elif function_code == 0x04:  # Read Input Registers
-                response = self._handle_read_input_registers(slave_id, request_data)
-            elif function_code == 0x01:  # Read Coils
-                response = self._handle_read_coils(slave_id, request_data)
-            elif function_code == 0x02:  # Read Discrete Inputs
-                response = self._handle_read_discrete_inputs(slave_id, request_data)
-            elif function_code == 0x05:  # Write Single Coil
-                response = self._handle_write_single_coil(slave_id, request_data)
-            elif function_code == 0x06:  # Write Single Register
-                response = self._handle_write_single_register(slave_id, request_data)
-            elif function_code == 0x0F:  # Write Multiple Coils
-                response = self._handle_write_multiple_coils(slave_id, request_data)
-            elif function_code == 0x10:  # Write Multiple Registers
-                response = self._handle_write_multiple_registers(slave_id, request_data)
-            elif function_code == 0x14:  # Read File Records
-                response = self._handle_read_file_records(slave_id, request_data)
-            else:
+            handler = self._dispatch.get(function_code)
+            if handler is None:
                 self._send_exception_response(slave_id, function_code, 0x01)  # Illegal Function
                 return
+            response = handler(slave_id, request_data)
             
             if response:
                 self._send_response(response)
-                if slave_id in self.stats:
-                    self.stats[slave_id].successful_requests += 1
-                    self.stats[slave_id].bytes_sent += len(response)
-            else:
-                if slave_id in self.stats:
-                    self.stats[slave_id].failed_requests += 1
+                if stats is not None:
+                    with self._stats_lock:
+                        stats.successful_requests += 1
+                        stats.bytes_sent += len(response)
+                        self.stats_version += 1
+            elif stats is not None:
+                with self._stats_lock:
+                    stats.failed_requests += 1
+                    self.stats_version += 1
                     
         except Exception as e:
-            self.logger.error(f"Error processing request: {e}")
+            self.logger.error("Error processing request: %s", e)
             if len(request_data) >= 2:
                 self._send_exception_response(request_data[0], request_data[1], 0x04)  # Server Device Failure
     
@@ -426,31 +512,26 @@ class ModbusIndustrialServer:
         if len(request_data) < 8:
             return None
         
-        start_address = (request_data[2] << 8) | request_data[3]
-        quantity = (request_data[4] << 8) | request_data[5]
+        start_address, quantity = _ADDR_QTY.unpack_from(request_data, 2)
         
         if quantity < 1 or quantity > 125:
             self._send_exception_response(slave_id, 0x03, 0x03)  # Illegal Data Value
             return None
         
         slave = self.slaves[slave_id]
-        response_data = [slave_id, 0x03, quantity * 2]  # byte count
         
         try:
-            for addr in range(start_address, start_address + quantity):
-                if addr in slave.holding_registers:
-                    value = slave.holding_registers[addr]
-                    response_data.extend([(value >> 8) & 0xFF, value & 0xFF])
-                else:
-                    # Return 0 for non-existent registers
-                    response_data.extend([0x00, 0x00])
-            
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            # Return 0 for non-existent registers
+            registers = slave.holding_registers
+            values = [registers.get(addr, 0) & 0xFFFF for addr in range(start_address, start_address + quantity)]
+            packer = _register_response(quantity)
+            response = bytearray(packer.size + 2)  # Room for the CRC
+            packer.pack_into(response, 0, slave_id, 0x03, quantity * 2, *values)
+            response[-2:] = self._calculate_crc(memoryview(response)[:-2])
+            return response
             
         except Exception as e:
-            self.logger.error(f"Error reading holding registers: {e}")
+            self.logger.error("Error reading holding registers: %s", e)
             self._send_exception_response(slave_id, 0x03, 0x04)  # Server Device Failure
             return None
     
@@ -459,30 +540,25 @@ class ModbusIndustrialServer:
         if len(request_data) < 8:
             return None
         
-        start_address = (request_data[2] << 8) | request_data[3]
-        quantity = (request_data[4] << 8) | request_data[5]
+        start_address, quantity = _ADDR_QTY.unpack_from(request_data, 2)
         
         if quantity < 1 or quantity > 125:
             self._send_exception_response(slave_id, 0x04, 0x03)  # Illegal Data Value
             return None
         
         slave = self.slaves[slave_id]
-        response_data = [slave_id, 0x04, quantity * 2]  # byte count
         
         try:
-            for addr in range(start_address, start_address + quantity):
-                if addr in slave.input_registers:
-                    value = slave.input_registers[addr]
-                    response_data.extend([(value >> 8) & 0xFF, value & 0xFF])
-                else:
-                    response_data.extend([0x00, 0x00])
-            
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            registers = slave.input_registers
+            values = [registers.get(addr, 0) & 0xFFFF for addr in range(start_address, start_address + quantity)]
+            packer = _register_response(quantity)
+            response = bytearray(packer.size + 2)  # Room for the CRC
+            packer.pack_into(response, 0, slave_id, 0x04, quantity * 2, *values)
+            response[-2:] = self._calculate_crc(memoryview(response)[:-2])
+            return response
             
         except Exception as e:
-            self.logger.error(f"Error reading input registers: {e}")
+            self.logger.error("Error reading input registers: %s", e)
             self._send_exception_response(slave_id, 0x04, 0x04)  # Server Device Failure
             return None
     
@@ -491,8 +567,7 @@ class ModbusIndustrialServer:
         if len(request_data) < 8:
             return None
         
-        start_address = (request_data[2] << 8) | request_data[3]
-        quantity = (request_data[4] << 8) | request_data[5]
+        start_address, quantity = _ADDR_QTY.unpack_from(request_data, 2)
         
         if quantity < 1 or quantity > 2000:
             self._send_exception_response(slave_id, 0x01, 0x03)  # Illegal Data Value
@@ -500,26 +575,15 @@ class ModbusIndustrialServer:
         
         slave = self.slaves[slave_id]
         byte_count = (quantity + 7) // 8  # Round up to nearest byte
-        response_data = [slave_id, 0x01, byte_count]
         
         try:
-            coil_bytes = []
-            for byte_idx in range(byte_count):
-                byte_value = 0
-                for bit_idx in range(8):
-                    coil_addr = start_address + byte_idx * 8 + bit_idx
-                    if coil_addr < start_address + quantity:
-                        if coil_addr in slave.coils and slave.coils[coil_addr]:
-                            byte_value |= (1 << bit_idx)
-                coil_bytes.append(byte_value)
-            
-            response_data.extend(coil_bytes)
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            response = bytearray((slave_id, 0x01, byte_count))
+            response += _pack_bits(slave.coils, start_address, quantity)
+            response += self._calculate_crc(response)
+            return response
             
         except Exception as e:
-            self.logger.error(f"Error reading coils: {e}")
+            self.logger.error("Error reading coils: %s", e)
             self._send_exception_response(slave_id, 0x01, 0x04)  # Server Device Failure
             return None
     
@@ -528,8 +592,7 @@ class ModbusIndustrialServer:
         if len(request_data) < 8:
             return None
         
-        start_address = (request_data[2] << 8) | request_data[3]
-        quantity = (request_data[4] << 8) | request_data[5]
+        start_address, quantity = _ADDR_QTY.unpack_from(request_data, 2)
         
         if quantity < 1 or quantity > 2000:
             self._send_exception_response(slave_id, 0x02, 0x03)  # Illegal Data Value
@@ -537,26 +600,15 @@ class ModbusIndustrialServer:
         
         slave = self.slaves[slave_id]
         byte_count = (quantity + 7) // 8  # Round up to nearest byte
-        response_data = [slave_id, 0x02, byte_count]
         
         try:
-            input_bytes = []
-            for byte_idx in range(byte_count):
-                byte_value = 0
-                for bit_idx in range(8):
-                    input_addr = start_address + byte_idx * 8 + bit_idx
-                    if input_addr < start_address + quantity:
-                        if input_addr in slave.discrete_inputs and slave.discrete_inputs[input_addr]:
-                            byte_value |= (1 << bit_idx)
-                input_bytes.append(byte_value)
-            
-            response_data.extend(input_bytes)
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            response = bytearray((slave_id, 0x02, byte_count))
+            response += _pack_bits(slave.discrete_inputs, start_address, quantity)
+            response += self._calculate_crc(response)
+            return response
             
         except Exception as e:
-            self.logger.error(f"Error reading discrete inputs: {e}")
+            self.logger.error("Error reading discrete inputs: %s", e)
             self._send_exception_response(slave_id, 0x02, 0x04)  # Server Device Failure
             return None
     
@@ -565,8 +617,7 @@ class ModbusIndustrialServer:
         if len(request_data) < 8:
             return None
         
-        coil_address = (request_data[2] << 8) | request_data[3]
-        coil_value = (request_data[4] << 8) | request_data[5]
+        coil_address, coil_value = _ADDR_QTY.unpack_from(request_data, 2)
         
         if coil_value not in [0x0000, 0xFF00]:
             self._send_exception_response(slave_id, 0x05, 0x03)  # Illegal Data Value
@@ -577,13 +628,11 @@ class ModbusIndustrialServer:
         try:
             slave.coils[coil_address] = (coil_value == 0xFF00)
             
-            # Echo back the request as response
-            response_bytes = request_data[:-2]  # Remove CRC
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            # Echo back the request as response; its CRC was already validated
+            return request_data
             
         except Exception as e:
-            self.logger.error(f"Error writing single coil: {e}")
+            self.logger.error("Error writing single coil: %s", e)
             self._send_exception_response(slave_id, 0x05, 0x04)  # Server Device Failure
             return None
     
@@ -592,21 +641,18 @@ class ModbusIndustrialServer:
         if len(request_data) < 8:
             return None
         
-        register_address = (request_data[2] << 8) | request_data[3]
-        register_value = (request_data[4] << 8) | request_data[5]
+        register_address, register_value = _ADDR_QTY.unpack_from(request_data, 2)
         
         slave = self.slaves[slave_id]
         
         try:
             slave.holding_registers[register_address] = register_value
             
-            # Echo back the request as response
-            response_bytes = request_data[:-2]  # Remove CRC
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            # Echo back the request as response; its CRC was already validated
+            return request_data
             
         except Exception as e:
-            self.logger.error(f"Error writing single register: {e}")
+            self.logger.error("Error writing single register: %s", e)
             self._send_exception_response(slave_id, 0x06, 0x04)  # Server Device Failure
             return None
     
@@ -615,8 +661,7 @@ class ModbusIndustrialServer:
         if len(request_data) < 9:
             return None
         
-        start_address = (request_data[2] << 8) | request_data[3]
-        quantity = (request_data[4] << 8) | request_data[5]
+        start_address, quantity = _ADDR_QTY.unpack_from(request_data, 2)
         byte_count = request_data[6]
         
         if quantity < 1 or quantity > 1968 or byte_count != (quantity + 7) // 8:
@@ -628,21 +673,17 @@ class ModbusIndustrialServer:
         try:
             coil_data = request_data[7:7+byte_count]
             
-            for i in range(quantity):
-                byte_idx = i // 8
-                bit_idx = i % 8
-                coil_address = start_address + i
-                coil_value = bool(coil_data[byte_idx] & (1 << bit_idx))
-                slave.coils[coil_address] = coil_value
+            # Coil data is LSB first, so the whole field reads as one little-endian int
+            bits = int.from_bytes(coil_data, 'little')
+            slave.coils.update((start_address + i, bool((bits >> i) & 1)) for i in range(quantity))
             
             # Response: slave_id + function_code + start_address + quantity + CRC
-            response_data = [slave_id, 0x0F] + list(request_data[2:6])
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            response = bytearray(request_data[:6])
+            response += self._calculate_crc(response)
+            return response
             
         except Exception as e:
-            self.logger.error(f"Error writing multiple coils: {e}")
+            self.logger.error("Error writing multiple coils: %s", e)
             self._send_exception_response(slave_id, 0x0F, 0x04)  # Server Device Failure
             return None
     
@@ -651,8 +692,7 @@ class ModbusIndustrialServer:
         if len(request_data) < 9:
             return None
         
-        start_address = (request_data[2] << 8) | request_data[3]
-        quantity = (request_data[4] << 8) | request_data[5]
+        start_address, quantity = _ADDR_QTY.unpack_from(request_data, 2)
         byte_count = request_data[6]
         
         if quantity < 1 or quantity > 123 or byte_count != quantity * 2:
@@ -662,21 +702,16 @@ class ModbusIndustrialServer:
         slave = self.slaves[slave_id]
         
         try:
-            register_data = request_data[7:7+byte_count]
-            
-            for i in range(quantity):
-                register_address = start_address + i
-                register_value = (register_data[i*2] << 8) | register_data[i*2 + 1]
-                slave.holding_registers[register_address] = register_value
+            values = _register_values(quantity).unpack_from(request_data, 7)
+            slave.holding_registers.update(zip(range(start_address, start_address + quantity), values))
             
             # Response: slave_id + function_code + start_address + quantity + CRC
-            response_data = [slave_id, 0x10] + list(request_data[2:6])
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            return response_bytes + crc
+            response = bytearray(request_data[:6])
+            response += self._calculate_crc(response)
+            return response
             
         except Exception as e:
-            self.logger.error(f"Error writing multiple registers: {e}")
+            self.logger.error("Error writing multiple registers: %s", e)
             self._send_exception_response(slave_id, 0x10, 0x04)  # Server Device Failure
             return None
     
@@ -691,9 +726,7 @@ class ModbusIndustrialServer:
             return None
         
         reference_type = request_data[3]
-        file_number = (request_data[4] << 8) | request_data[5]
-        record_number = (request_data[6] << 8) | request_data[7]
-        record_length = (request_data[8] << 8) | request_data[9]
+        file_number, record_number, record_length = _FILE_RECORD_REQUEST.unpack_from(request_data, 4)
         
         if reference_type != 6:  # Only support reference type 6
             self._send_exception_response(slave_id, 0x14, 0x03)  # Illegal Data Value
@@ -705,57 +738,41 @@ class ModbusIndustrialServer:
             if file_number in slave.file_records and record_number in slave.file_records[file_number]:
                 file_data = slave.file_records[file_number][record_number]
                 # Truncate or pad data to requested length
-                if len(file_data) > record_length * 2:
-                    file_data = file_data[:record_length * 2]
-                elif len(file_data) < record_length * 2:
-                    file_data = file_data + b'\x00' * (record_length * 2 - len(file_data))
+                file_data = file_data[:record_length * 2].ljust(record_length * 2, b'\x00')
                 
                 # Response format: slave_id + function_code + response_data_length + file_response_length + reference_type + data + CRC
                 file_response_length = len(file_data) + 1  # +1 for reference type
                 response_data_length = file_response_length + 1  # +1 for file_response_length byte
                 
-                response_data = [slave_id, 0x14, response_data_length, file_response_length, reference_type]
-                response_data.extend(file_data)
-                
-                response_bytes = bytes(response_data)
-                crc = self._calculate_crc(response_bytes)
-                return response_bytes + crc
+                response = bytearray((slave_id, 0x14, response_data_length, file_response_length, reference_type))
+                response += file_data
+                response += self._calculate_crc(response)
+                return response
             else:
                 # File or record not found, return empty data
                 file_response_length = 1  # Only reference type
                 response_data_length = 2  # file_response_length + reference_type
                 
-                response_data = [slave_id, 0x14, response_data_length, file_response_length, reference_type]
-                response_bytes = bytes(response_data)
-                crc = self._calculate_crc(response_bytes)
-                return response_bytes + crc
+                response = bytearray((slave_id, 0x14, response_data_length, file_response_length, reference_type))
+                response += self._calculate_crc(response)
+                return response
                 
         except Exception as e:
-            self.logger.error(f"Error reading file records: {e}")
+            self.logger.error("Error reading file records: %s", e)
             self._send_exception_response(slave_id, 0x14, 0x04)  # Server Device Failure
             return None
     
     def _calculate_crc(self, data: bytes) -> bytes:
         """Calculate CRC-16 Modbus"""
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if (crc & 0x0001):
-                    crc >>= 1
-                    crc ^= 0xA001
-                else:
-                    crc >>= 1
-        return crc.to_bytes(2, 'little')
+        return modbus_crc.calculate_crc(data)
     
     def _validate_crc(self, data: bytes) -> bool:
         """Validate CRC-16 of received data"""
         if len(data) < 3:
             return False
         
-        received_crc = data[-2:]
-        calculated_crc = self._calculate_crc(data[:-2])
-        return received_crc == calculated_crc
+        # A frame followed by its own CRC leaves a zero residue
+        return modbus_crc.crc_ok(data)
     
     def _send_response(self, response: bytes):
         """Send response to serial port"""
@@ -764,28 +781,27 @@ class ModbusIndustrialServer:
                 self.serial_port.write(response)
                 self.serial_port.flush()
         except Exception as e:
-            self.logger.error(f"Error sending response: {e}")
+            self.logger.error("Error sending response: %s", e)
     
     def _send_exception_response(self, slave_id: int, function_code: int, exception_code: int):
         """Send Modbus exception response"""
         try:
-            response_data = [slave_id, function_code | 0x80, exception_code]
-            response_bytes = bytes(response_data)
-            crc = self._calculate_crc(response_bytes)
-            full_response = response_bytes + crc
+            response = bytearray((slave_id, function_code | 0x80, exception_code))
+            response += self._calculate_crc(response)
             
-            self._send_response(full_response)
-            self.logger.warning(f"Sent exception response: Slave {slave_id}, Function 0x{function_code:02X}, Exception 0x{exception_code:02X}")
+            self._send_response(response)
+            self.logger.warning("Sent exception response: Slave %s, Function 0x%02X, Exception 0x%02X", slave_id, function_code, exception_code)
             
         except Exception as e:
-            self.logger.error(f"Error sending exception response: {e}")
+            self.logger.error("Error sending exception response: %s", e)
     
     def _start_stats_reporting(self):
         """Start statistics reporting thread"""
         def stats_worker():
+            interval = self.config['server']['stats_interval']
             while self.is_running:
                 try:
-                    time.sleep(self.config['server']['stats_interval'])
+                    time.sleep(interval)
                     if self.is_running:
                         self._log_statistics()
                 except Exception as e:
@@ -797,7 +813,7 @@ class ModbusIndustrialServer:
     def _log_statistics(self):
         """Log server statistics"""
         try:
-            total_requests = sum(stats.total_requests for stats in self.stats.values())
+            total_requests = self.total_requests
             total_successful = sum(stats.successful_requests for stats in self.stats.values())
             total_failed = sum(stats.failed_requests for stats in self.stats.values())
             
@@ -832,7 +848,7 @@ class ModbusIndustrialServer:
             'input_registers': dict(slave.input_registers),
             'coils': dict(slave.coils),
             'discrete_inputs': dict(slave.discrete_inputs),
-            'statistics': asdict(stats)
+            'statistics': stats.to_dict()
         }
     
     def update_register(self, slave_id: int, register_type: str, address: int, value: Any) -> bool:
@@ -854,7 +870,7 @@ class ModbusIndustrialServer:
             else:
                 return False
             
-            self.logger.debug(f"Updated {register_type} register {address} = {value} for slave {slave_id}")
+            self.logger.debug("Updated %s register %s = %s for slave %s", register_type, address, value, slave_id)
             return True
             
         except Exception as e:
@@ -865,10 +881,18 @@ class ModbusIndustrialServer:
 class PerformanceMonitor:
     """Performance monitoring for Pi Zero 2W optimization"""
     
-    def __init__(self):
+    def __init__(self, cpu_check_interval: float = 10, memory_check_interval: float = 30):
         self.is_monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # Wakes the loop immediately on stop()
         self.logger = logging.getLogger('PerformanceMonitor')
+        self.cpu_check_interval = cpu_check_interval
+        self.memory_check_interval = memory_check_interval
+        
+        # Last samples, for readers that must not touch psutil themselves
+        self.cpu_percent = 0.0
+        self.memory_usage_mb = 0.0
+        self.memory_percent = 0.0
     
     def start(self):
         """Start performance monitoring"""
@@ -876,6 +900,7 @@ class PerformanceMonitor:
             return
         
         self.is_monitoring = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         self.logger.info("Performance monitoring started")
@@ -883,38 +908,39 @@ class PerformanceMonitor:
     def stop(self):
         """Stop performance monitoring"""
         self.is_monitoring = False
+        self._stop_event.set()
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=2)
         self.logger.info("Performance monitoring stopped")
     
     def _monitor_loop(self):
         """Performance monitoring loop"""
-        while self.is_monitoring:
+        # Prime the counter so each later non-blocking call averages over the whole interval
+        psutil.cpu_percent(interval=None)
+        next_memory_check = 0.0
+        
+        while not self._stop_event.wait(self.cpu_check_interval):
             try:
-                # Check memory usage
-                memory_info = psutil.virtual_memory()
-                memory_usage_mb = memory_info.used / 1024 / 1024
-                memory_percent = memory_info.percent
-                
-                # Check CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
+                # Check CPU usage since the previous sample
+                self.cpu_percent = psutil.cpu_percent(interval=None)
+                if self.cpu_percent > PI_ZERO_CONFIG['cpu_threshold']:
+                    self.logger.warning("CPU usage high: %.1f%%", self.cpu_percent)
                 
-                # Log warnings if thresholds exceeded
-                if memory_usage_mb > PI_ZERO_CONFIG['memory_limit_mb']:
-                    self.logger.warning(f"Memory usage high: {memory_usage_mb:.1f}MB ({memory_percent:.1f}%)")
-                
-                if cpu_percent > PI_ZERO_CONFIG['cpu_threshold']:
-                    self.logger.warning(f"CPU usage high: {cpu_percent:.1f}%")
+                # Check memory usage
+                now = time.monotonic()
+                if now >= next_memory_check:
+                    next_memory_check = now + self.memory_check_interval
+                    memory_info = psutil.virtual_memory()
+                    self.memory_usage_mb = memory_info.used / 1024 / 1024
+                    self.memory_percent = memory_info.percent
+                    if self.memory_usage_mb > PI_ZERO_CONFIG['memory_limit_mb']:
+                        self.logger.warning("Memory usage high: %.1fMB (%.1f%%)", self.memory_usage_mb, self.memory_percent)
                 
                 # Log periodic status
-                self.logger.debug(f"Performance: CPU {cpu_percent:.1f}%, Memory {memory_usage_mb:.1f}MB")
-                
-                time.sleep(30)  # Check every 30 seconds
+                self.logger.debug("Performance: CPU %.1f%%, Memory %.1fMB", self.cpu_percent, self.memory_usage_mb)
                 
             except Exception as e:
-                self.logger.error(f"Error in performance monitoring: {e}")
-                time.sleep(10)
-
+                self.logger.error("Error in performance monitoring: %s", e)
 
 def create_example_slave() -> SlaveConfig:
     """Create an example slave configuration"""
@@ -975,17 +1001,12 @@ def main():
         print(f"Discrete inputs: {len(example_slave.discrete_inputs)}")
         print()
         
-        # Start server
+        # Start server; the serial loop runs on the main thread
         print("Starting Modbus server...")
-        server.start_server()
-        
-        print("Server started successfully!")
         print("Press Ctrl+C to stop the server")
         
-        # Keep the main thread alive
         try:
-            while True:
-                time.sleep(1)
+            server.run_forever()
         except KeyboardInterrupt:
             print("\nShutting down server...")
             server.stop_server()